@@ -79,6 +79,54 @@ resource "aws_ecs_cluster" "ecs_cluster" {
   }
 }
 
+# Stopped task events of the cluster, consumed by executors instead of polling ECS
+resource "aws_sqs_queue" "task_events" {
+  name                      = "${local.prefix}-task-events"
+  message_retention_seconds = 300
+}
+
+resource "aws_cloudwatch_event_rule" "task_stopped" {
+  name        = "${local.prefix}-task-stopped"
+  description = "ECS tasks stopped in the ${aws_ecs_cluster.ecs_cluster.name} cluster"
+
+  event_pattern = jsonencode({
+    "source" : ["aws.ecs"],
+    "detail-type" : ["ECS Task State Change"],
+    "detail" : {
+      "clusterArn" : [aws_ecs_cluster.ecs_cluster.arn],
+      "lastStatus" : ["STOPPED"]
+    }
+  })
+}
+
+resource "aws_cloudwatch_event_target" "task_stopped" {
+  rule = aws_cloudwatch_event_rule.task_stopped.name
+  arn  = aws_sqs_queue.task_events.arn
+}
+
+resource "aws_sqs_queue_policy" "task_events" {
+  queue_url = aws_sqs_queue.task_events.id
+
+  policy = jsonencode({
+    "Version" : "2012-10-17",
+    "Statement" : [
+      {
+        "Effect" : "Allow",
+        "Principal" : {
+          "Service" : "events.amazonaws.com"
+        },
+        "Action" : "sqs:SendMessage",
+        "Resource" : aws_sqs_queue.task_events.arn,
+        "Condition" : {
+          "ArnEquals" : {
+            "aws:SourceArn" : aws_cloudwatch_event_rule.task_stopped.arn
+          }
+        }
+      }
+    ]
+  })
+}
+
 # Executor Covalent config section
 data "template_file" "executor_config" {
   template = file("${path.module}/ecs.conf.tftpl")
@@ -94,6 +142,7 @@ data "template_file" "executor_config" {
     ecs_task_subnet_id           = module.vpc.public_subnets[0]
     ecs_task_security_group_id   = aws_security_group.sg.id
     ecs_task_log_group_name      = aws_cloudwatch_log_group.log_group.name
+    ecs_task_event_queue_url     = aws_sqs_queue.task_events.id
     vcpu                         = var.vcpus
     memory                       = var.memory
     cache_dir                    = var.cache_dir
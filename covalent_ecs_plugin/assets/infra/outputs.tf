@@ -48,3 +48,8 @@ output "ecs_task_log_group_name" {
   value = aws_cloudwatch_log_group.log_group.name
   description = "Name of log group associated with ECS cluster"
 }
+
+output "ecs_task_event_queue_url" {
+  value = aws_sqs_queue.task_events.id
+  description = "URL of SQS queue receiving the stopped task events of the ECS cluster"
+}
@@ -17,21 +17,33 @@
 """AWS ECSExecutor plugin for the Covalent dispatcher."""
 
 import asyncio
+import io
 import os
+import pickle
+import random
 import re
-import tempfile
+import threading
+from collections import OrderedDict
 from functools import partial
-from pathlib import Path
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 import boto3
-import cloudpickle as pickle
+import botocore.session
+from botocore.exceptions import ClientError
 from covalent._shared_files.config import get_config
 from covalent._shared_files.logger import app_log
 from covalent_aws_plugins import AWSExecutor
+from covalent_aws_plugins.exceptions.invalid_credentials import InvalidCredentials
 from pydantic import BaseModel
 
-from .utils import _execute_partial_in_threadpool, _load_pickle_file
+from .utils import (
+    BOTO_CLIENT_CONFIG,
+    _execute_partial_in_threadpool,
+    _get_event_task_arn,
+    _get_task_definition_key,
+    _load_pickle_file,
+    _serialize_task,
+)
 
 
 class ExecutorPluginDefaults(BaseModel):
@@ -45,6 +57,7 @@ class ExecutorPluginDefaults(BaseModel):
     ecs_task_subnet_id: str = ""
     ecs_task_security_group_id: str = ""
     ecs_task_log_group_name: str = "covalent-fargate-task-logs"
+    ecs_task_event_queue_url: str = ""
     vcpu: float = 0.25
     memory: float = 0.5
     cache_dir: str = "/tmp/covalent"
@@ -79,11 +92,32 @@ EXECUTOR_PLUGIN_NAME = "ECSExecutor"
 
 FUNC_FILENAME = "func-{dispatch_id}-{node_id}.pkl"
 RESULT_FILENAME = "result-{dispatch_id}-{node_id}.pkl"
-CONTAINER_NAME = "covalent-task-{dispatch_id}-{node_id}"
+CONTAINER_NAME = "covalent-task"
+TASK_FAMILY_NAME = "covalent-task"
 COVALENT_EXEC_BASE_URI = os.getenv(
     "COVALENT_EXEC_BASE_URI", "public.ecr.aws/covalent/covalent-executor-base:stable"
 )
 
+SUBNET_ID_PATTERN = re.compile(r"subnet-[0-9a-z]{8,17}")
+SECURITY_GROUP_ID_PATTERN = re.compile(r"sg-[0-9a-z]{8,17}")
+# run_task errors about a task definition revision that was deregistered or deleted.
+INACTIVE_TASK_DEFINITION_ERROR_CODES = ("ClientException", "InvalidParameterException")
+INACTIVE_TASK_DEFINITION_PATTERN = re.compile(
+    r"task ?definition.*\b(inactive|not found|does not exist)\b"
+    r"|unable to (describe|find) task ?definition",
+    re.IGNORECASE,
+)
+
+# Maximum long-poll duration (the SQS maximum) of a receive from the task event queue.
+TASK_EVENT_WAIT_TIME = 20
+# Seconds after which the status of a task is checked even though no event about it
+# arrived, in case the event was consumed by another process.
+TASK_EVENT_STATUS_CHECK_INTERVAL = 300
+# Maximum number of registered task definition ARNs remembered by the process.
+TASK_DEFINITION_CACHE_SIZE = 128
+# Results larger than this are downloaded to the cache directory instead of read into memory.
+RESULT_MAX_IN_MEMORY_SIZE = 128 * 1024 * 1024
+
 
 class ECSExecutor(AWSExecutor):
     """AWS ECSExecutor plugin class.
@@ -98,12 +132,34 @@ class ECSExecutor(AWSExecutor):
         ecs_task_subnet_id: Valid subnet ID.
         ecs_task_security_group_id: Valid security group ID.
         ecs_task_log_group_name: Name of the CloudWatch log group where container logs are stored.
+        ecs_task_event_queue_url: Optional URL of an SQS queue receiving the ECS task state
+            change events of the cluster, used to wait for task completion instead of polling.
         vcpu: Number of vCPUs available to a task.
         memory: Memory (in GB) available to a task.
         poll_freq: Frequency with which to poll a submitted task.
         cache_dir: Cache directory used by this executor for temporary files.
     """
 
+    # ARNs of the task definitions most recently registered by this process, keyed by a
+    # digest of their registration parameters, so that identical definitions are
+    # registered once.
+    _task_definition_arns: "OrderedDict[str, str]" = OrderedDict()
+
+    # boto3 sessions keyed by (profile, region, credentials file) and the clients created
+    # from them, shared by all executors in the process so that credentials and service
+    # models are loaded once. They are kept on the class because instance attributes
+    # must remain serializable.
+    _boto_sessions: Dict[Tuple[Optional[str], ...], boto3.Session] = {}
+    _boto_clients: Dict[Tuple[Optional[str], ...], Any] = {}
+    _boto_lock = threading.Lock()
+    # STS caller identities, keyed like the boto3 sessions, so that the credentials of
+    # each session are validated once per process.
+    _caller_identities: Dict[Tuple[Optional[str], ...], Dict[str, str]] = {}
+    # Events set when the state change event of a polled task arrives, keyed by event queue
+    # URL and task ARN, and the consumers delivering them, one per event queue.
+    _task_events: Dict[str, Dict[str, asyncio.Event]] = {}
+    _task_event_consumers: Dict[str, asyncio.Task] = {}
+
     def __init__(
         self,
         s3_bucket_name: str = None,
@@ -113,6 +169,7 @@ class ECSExecutor(AWSExecutor):
         ecs_task_role_name: str = None,
         ecs_task_subnet_id: str = None,
         ecs_task_log_group_name: str = None,
+        ecs_task_event_queue_url: str = None,
         region: str = None,
         credentials: str = None,
         profile: str = None,
@@ -145,9 +202,12 @@ class ECSExecutor(AWSExecutor):
         self.ecs_task_security_group_id = ecs_task_security_group_id or get_config(
             "executors.ecs.ecs_task_security_group_id"
         )
+        self.ecs_task_event_queue_url = ecs_task_event_queue_url or get_config(
+            "executors.ecs.ecs_task_event_queue_url"
+        )
         self.vcpu = vcpu or get_config("executors.ecs.vcpu")
         self.memory = memory or get_config("executors.ecs.memory")
-        self._ecs_task_family_name = ""
+        self._ecs_task_family_name = TASK_FAMILY_NAME
 
         if self.cache_dir == "":
             self.cache_dir = get_config("executors.ecs.cache_dir")
@@ -162,49 +222,118 @@ class ECSExecutor(AWSExecutor):
                 f"{self.ecs_task_security_group_id} is not a valid security group id. Please set a valid security group id either in the ECS executor definition or in the Covalent config file."
             )
 
+    @property
+    def credentials_file(self):
+        return self._credentials_file
+
+    @credentials_file.setter
+    def credentials_file(self, credentials_file):
+        # Unlike the base class, do not export the credentials file through
+        # os.environ; it is passed explicitly to each boto3 session instead.
+        self._credentials_file = credentials_file or None
+
+    def _get_boto_session(self) -> boto3.Session:
+        """Get the boto3 session for the executor's profile, region and credentials file."""
+        key = (self.profile, self.region, self.credentials_file)
+        with ECSExecutor._boto_lock:
+            if key not in ECSExecutor._boto_sessions:
+                botocore_session = botocore.session.Session()
+                if self.credentials_file:
+                    botocore_session.set_config_variable("credentials_file", self.credentials_file)
+                ECSExecutor._boto_sessions[key] = boto3.Session(
+                    botocore_session=botocore_session, **self.boto_session_options()
+                )
+            return ECSExecutor._boto_sessions[key]
+
+    def _get_client(self, service_name: str):
+        """Get the client for an AWS service, created once per boto3 session."""
+        key = (self.profile, self.region, self.credentials_file, service_name)
+        if (client := ECSExecutor._boto_clients.get(key)) is not None:
+            return client
+
+        boto_session = self._get_boto_session()
+        # Unlike the clients they create, boto3 sessions are not thread-safe.
+        with ECSExecutor._boto_lock:
+            if key not in ECSExecutor._boto_clients:
+                ECSExecutor._boto_clients[key] = boto_session.client(
+                    service_name, config=BOTO_CLIENT_CONFIG
+                )
+            return ECSExecutor._boto_clients[key]
+
+    async def _get_client_async(self, service_name: str):
+        """Get the client for an AWS service without blocking the event loop.
+
+        Creating the session and client reads the AWS config files and service models, so
+        only clients that are not cached yet are fetched in the threadpool.
+        """
+        key = (self.profile, self.region, self.credentials_file, service_name)
+        if (client := ECSExecutor._boto_clients.get(key)) is not None:
+            return client
+        return await _execute_partial_in_threadpool(partial(self._get_client, service_name))
+
+    def _validate_credentials(self, raise_exception: bool = True) -> Union[Dict[str, str], bool]:
+        """Validate AWS credentials from the supplied profile and credentials file.
+
+        Args:
+            raise_exception: Whether to raise an exception if the credentials are invalid.
+
+        Returns:
+            identity: Caller identity returned by STS, or False if the credentials are
+                invalid and raise_exception is False.
+        """
+        try:
+            sts = self._get_client("sts")
+            return sts.get_caller_identity()
+        except ClientError as e:
+            if raise_exception:
+                raise InvalidCredentials(e, self.profile, self.credentials_file) from e
+            return False
+
+    async def _get_caller_identity(self) -> Dict[str, str]:
+        """Get the caller identity, validating the credentials on first use.
+
+        Returns:
+            identity: Caller identity returned by STS.
+        """
+        key = (self.profile, self.region, self.credentials_file)
+        if key not in ECSExecutor._caller_identities:
+            ECSExecutor._caller_identities[key] = await _execute_partial_in_threadpool(
+                partial(self._validate_credentials, raise_exception=True)
+            )
+        return ECSExecutor._caller_identities[key]
+
     def _upload_task_to_s3(self, dispatch_id, node_id, function, args, kwargs) -> None:
         """Upload task to S3."""
-        s3 = boto3.Session(**self.boto_session_options()).client("s3")
+        s3 = self._get_client("s3")
         s3_object_filename = FUNC_FILENAME.format(dispatch_id=dispatch_id, node_id=node_id)
 
-        with tempfile.NamedTemporaryFile(dir=self.cache_dir) as function_file:
-            # Write serialized function to file
-            pickle.dump((function, args, kwargs), function_file)
-            function_file.flush()
-            s3.upload_file(function_file.name, self.s3_bucket_name, s3_object_filename)
+        function_file = io.BytesIO(_serialize_task(function, args, kwargs))
+        s3.upload_fileobj(function_file, self.s3_bucket_name, s3_object_filename)
 
-    async def _upload_task(
+    def _upload_task(
         self, function: Callable, args: List, kwargs: Dict, task_metadata: Dict
-    ):
+    ) -> Awaitable[None]:
         """Wrapper to make boto3 s3 upload calls async."""
-        dispatch_id = task_metadata["dispatch_id"]
-        node_id = task_metadata["node_id"]
         partial_func = partial(
             self._upload_task_to_s3,
-            dispatch_id,
-            node_id,
+            task_metadata["dispatch_id"],
+            task_metadata["node_id"],
             function,
             args,
             kwargs,
         )
-        return await _execute_partial_in_threadpool(partial_func)
+        return _execute_partial_in_threadpool(partial_func)
 
     async def submit_task(self, task_metadata: Dict, identity: Dict) -> Any:
         """Submit task to ECS."""
         dispatch_id = task_metadata["dispatch_id"]
         node_id = task_metadata["node_id"]
-        container_name = CONTAINER_NAME.format(dispatch_id=dispatch_id, node_id=node_id)
         account = identity["Account"]
 
-        boto_session = boto3.Session(**self.boto_session_options())
-        ecs = boto_session.client("ecs")
+        ecs = await self._get_client_async("ecs")
+        region = ecs.meta.region_name
 
-        region = boto_session.region_name
-
-        # Register the task definition
-        self._debug_log("Registering ECS task definition...")
-        partial_func = partial(
-            ecs.register_task_definition,
+        task_definition = dict(
             family=self._ecs_task_family_name,
             taskRoleArn=self.ecs_task_role_name,
             executionRoleArn=f"arn:aws:iam::{account}:role/{self.execution_role}",
@@ -212,7 +341,7 @@ class ECSExecutor(AWSExecutor):
             requiresCompatibilities=["FARGATE"],
             containerDefinitions=[
                 {
-                    "name": container_name,
+                    "name": CONTAINER_NAME,
                     "image": COVALENT_EXEC_BASE_URI,
                     "essential": True,
                     "logConfiguration": {
@@ -226,31 +355,19 @@ class ECSExecutor(AWSExecutor):
                     },
                     "environment": [
                         {"name": "S3_BUCKET_NAME", "value": self.s3_bucket_name},
-                        {
-                            "name": "COVALENT_TASK_FUNC_FILENAME",
-                            "value": FUNC_FILENAME.format(
-                                dispatch_id=dispatch_id, node_id=node_id
-                            ),
-                        },
-                        {
-                            "name": "RESULT_FILENAME",
-                            "value": RESULT_FILENAME.format(
-                                dispatch_id=dispatch_id, node_id=node_id
-                            ),
-                        },
                     ],
                 },
             ],
             cpu=str(int(self.vcpu)),
             memory=str(int(self.memory * 1024)),
         )
-        await _execute_partial_in_threadpool(partial_func)
+        is_cached = _get_task_definition_key(task_definition) in ECSExecutor._task_definition_arns
+        task_definition_arn = await self._register_task_definition(ecs, task_definition)
 
         # Run the task
         self._debug_log("Running task on ECS...")
-        partial_func = partial(
+        run_task = partial(
             ecs.run_task,
-            taskDefinition=self._ecs_task_family_name,
             launchType="FARGATE",
             cluster=self.ecs_cluster_name,
             count=1,
@@ -262,17 +379,92 @@ class ECSExecutor(AWSExecutor):
                     "assignPublicIp": "ENABLED",
                 },
             },
+            # Per-task filenames are passed as overrides so that the task definition
+            # stays identical across dispatches and only needs to be registered once.
+            overrides={
+                "containerOverrides": [
+                    {
+                        "name": CONTAINER_NAME,
+                        "environment": [
+                            {
+                                "name": "COVALENT_TASK_FUNC_FILENAME",
+                                "value": FUNC_FILENAME.format(
+                                    dispatch_id=dispatch_id, node_id=node_id
+                                ),
+                            },
+                            {
+                                "name": "RESULT_FILENAME",
+                                "value": RESULT_FILENAME.format(
+                                    dispatch_id=dispatch_id, node_id=node_id
+                                ),
+                            },
+                        ],
+                    },
+                ],
+            },
         )
-        response = await _execute_partial_in_threadpool(partial_func)
+        try:
+            response = await _execute_partial_in_threadpool(
+                partial(run_task, taskDefinition=task_definition_arn)
+            )
+        except ClientError as e:
+            # The cached revision may have been deregistered since it was registered.
+            if not (is_cached and self._is_inactive_task_definition_error(e)):
+                raise
+            self._debug_log("Task definition is inactive, re-registering ECS task definition...")
+            task_definition_arn = await self._register_task_definition(
+                ecs, task_definition, use_cache=False
+            )
+            response = await _execute_partial_in_threadpool(
+                partial(run_task, taskDefinition=task_definition_arn)
+            )
         return response["tasks"][0]["taskArn"]
 
+    async def _register_task_definition(
+        self, ecs, task_definition: Dict, use_cache: bool = True
+    ) -> str:
+        """Register an ECS task definition unless an identical one was already registered.
+
+        Args:
+            ecs: ECS client used to register the task definition.
+            task_definition: Keyword arguments passed to `register_task_definition`.
+            use_cache: Whether to reuse a previously registered task definition.
+
+        Returns:
+            task_definition_arn: ARN of the (possibly previously) registered task definition.
+        """
+        key = _get_task_definition_key(task_definition)
+        if not use_cache:
+            ECSExecutor._task_definition_arns.pop(key, None)
+        elif key in ECSExecutor._task_definition_arns:
+            self._debug_log("Reusing previously registered ECS task definition...")
+            ECSExecutor._task_definition_arns.move_to_end(key)
+            return ECSExecutor._task_definition_arns[key]
+
+        self._debug_log("Registering ECS task definition...")
+        partial_func = partial(ecs.register_task_definition, **task_definition)
+        response = await _execute_partial_in_threadpool(partial_func)
+        task_definition_arn = response["taskDefinition"]["taskDefinitionArn"]
+        ECSExecutor._task_definition_arns[key] = task_definition_arn
+        if len(ECSExecutor._task_definition_arns) > TASK_DEFINITION_CACHE_SIZE:
+            ECSExecutor._task_definition_arns.popitem(last=False)
+        return task_definition_arn
+
+    def _is_inactive_task_definition_error(self, error: ClientError) -> bool:
+        """Check if a run_task error is about an inactive or missing task definition."""
+        error_info = error.response.get("Error", {})
+        return (
+            error_info.get("Code") in INACTIVE_TASK_DEFINITION_ERROR_CODES
+            and INACTIVE_TASK_DEFINITION_PATTERN.search(error_info.get("Message", "")) is not None
+        )
+
     def _is_valid_subnet_id(self, subnet_id: str) -> bool:
         """Check if the subnet is valid."""
-        return re.fullmatch(r"subnet-[0-9a-z]{8,17}", subnet_id) is not None
+        return SUBNET_ID_PATTERN.fullmatch(subnet_id) is not None
 
     def _is_valid_security_group(self, security_group: str) -> bool:
         """Check if the security group is valid."""
-        return re.fullmatch(r"sg-[0-9a-z]{8,17}", security_group) is not None
+        return SECURITY_GROUP_ID_PATTERN.fullmatch(security_group) is not None
 
     def _debug_log(self, message):
         app_log.debug(f"AWS ECS Executor: {message}")
@@ -282,18 +474,14 @@ class ECSExecutor(AWSExecutor):
         dispatch_id = task_metadata["dispatch_id"]
         node_id = task_metadata["node_id"]
 
-        if not (cache_dir_path := Path(self.cache_dir)).exists():
-            cache_dir_path.mkdir(parents=True, exist_ok=True)
-
-        self._ecs_task_family_name = f"{dispatch_id}-{node_id}"
-
         self._debug_log(f"Executing Dispatch ID {dispatch_id} Node {node_id}")
 
-        self._debug_log("Validating Credentials...")
-        identity = self._validate_credentials(raise_exception=True)
-
-        self._debug_log("Uploading task to S3...")
-        await self._upload_task(function, args, kwargs, task_metadata)
+        # The upload does not depend on the caller identity, so both run concurrently.
+        self._debug_log("Validating Credentials and uploading task to S3...")
+        identity, _ = await asyncio.gather(
+            self._get_caller_identity(),
+            self._upload_task(function, args, kwargs, task_metadata),
+        )
 
         self._debug_log("Submitting task...")
         task_arn = await self.submit_task(task_metadata, identity)
@@ -315,70 +503,176 @@ class ECSExecutor(AWSExecutor):
             status: String describing the task status.
             exit_code: Exit code, if the task has completed, else -1.
         """
-        ecs = boto3.Session(**self.boto_session_options()).client("ecs")
-        paginator = ecs.get_paginator("list_tasks")
+        ecs = await self._get_client_async("ecs")
         partial_func = partial(
-            paginator.paginate,
+            ecs.describe_tasks,
             cluster=self.ecs_cluster_name,
-            family=self._ecs_task_family_name,
-            desiredStatus="STOPPED",
+            tasks=[task_arn],
         )
-        page_iterator = await _execute_partial_in_threadpool(partial_func)
+        response = await _execute_partial_in_threadpool(partial_func)
 
-        for page in page_iterator:
-            if len(page["taskArns"]) == 0:
-                break
+        for task in response["tasks"]:
+            if task["taskArn"] == task_arn:
+                status = task["lastStatus"]
+                self._debug_log(f"Got status of task {task_arn}: {status}")
+                try:
+                    exit_code = int(task["containers"][0]["exitCode"])
+                except KeyError:
+                    exit_code = -1
 
-            partial_func = partial(
-                ecs.describe_tasks,
-                cluster=self.ecs_cluster_name,
-                tasks=page["taskArns"],
-            )
-            future = await _execute_partial_in_threadpool(partial_func)
-            tasks = future["tasks"]
+                return status, exit_code
 
-            for task in tasks:
-                if task["taskArn"] == task_arn:
-                    status = task["lastStatus"]
-                    self._debug_log(f"Got status of task {task_arn}: {status}")
-                    try:
-                        exit_code = int(task["containers"][0]["exitCode"])
-                    except KeyError:
-                        exit_code = -1
+        return ("TASK_NOT_FOUND", -1)
 
-                    return status, exit_code
+    def _poll_interval(self, attempt: int) -> float:
+        """Seconds to wait before a status poll, backing off exponentially up to poll_freq.
 
-        return ("TASK_NOT_FOUND", -1)
+        Args:
+            attempt: Number of polls already made after the first status check.
+        """
+        # Jitter keeps the pollers of tasks submitted together from polling in lockstep.
+        backoff = 2**attempt
+        if backoff >= self.poll_freq:
+            return self.poll_freq * (1 - 0.1 * random.random())
+        return min(self.poll_freq, backoff + random.random())
 
     async def _poll_task(self, task_arn: str) -> None:
         """Poll an ECS task until completion."""
         self._debug_log(f"Polling task with arn {task_arn}...")
-        status, exit_code = await self.get_status(task_arn)
+        queue_url = self.ecs_task_event_queue_url
+        if queue_url:
+            # Registered before the first status check so that no event is missed.
+            ECSExecutor._task_events.setdefault(queue_url, {})[task_arn] = asyncio.Event()
 
-        while status != "STOPPED":
-            await asyncio.sleep(self.poll_freq)
+        try:
             status, exit_code = await self.get_status(task_arn)
 
+            attempt = 0
+            while status != "STOPPED":
+                if queue_url:
+                    await self._wait_for_task_event(task_arn)
+                else:
+                    await asyncio.sleep(self._poll_interval(attempt))
+                    if 2**attempt < self.poll_freq:
+                        attempt += 1
+                status, exit_code = await self.get_status(task_arn)
+        finally:
+            if queue_url:
+                task_events = ECSExecutor._task_events.get(queue_url, {})
+                task_events.pop(task_arn, None)
+                if not task_events:
+                    ECSExecutor._task_events.pop(queue_url, None)
+
         if exit_code != 0:
             raise Exception(f"Task failed with exit code {exit_code}.")
 
+    async def _wait_for_task_event(self, task_arn: str) -> bool:
+        """Wait for the state change event of an ECS task.
+
+        The wait ends without an event after TASK_EVENT_STATUS_CHECK_INTERVAL, in case the
+        event was consumed by another process, or after poll_freq if the queue could not be
+        read, so that the task status is checked regardless.
+
+        Args:
+            task_arn: ARN used to identify an ECS task.
+
+        Returns:
+            Whether an event about the task was received.
+        """
+        queue_url = self.ecs_task_event_queue_url
+        loop = asyncio.get_running_loop()
+        consumer = ECSExecutor._task_event_consumers.get(queue_url)
+        if consumer is None or consumer.done() or consumer.get_loop() is not loop:
+            consumer = loop.create_task(self._consume_task_events())
+            ECSExecutor._task_event_consumers[queue_url] = consumer
+
+        task_event = ECSExecutor._task_events[queue_url][task_arn]
+        event_wait = loop.create_task(task_event.wait())
+        await asyncio.wait(
+            {event_wait, consumer},
+            timeout=max(self.poll_freq, TASK_EVENT_STATUS_CHECK_INTERVAL),
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        event_wait.cancel()
+
+        if task_event.is_set():
+            task_event.clear()
+            return True
+        if consumer.done():
+            # The consumer only stops while tasks are polled if receiving events failed.
+            await asyncio.sleep(self.poll_freq)
+        return False
+
+    async def _consume_task_events(self) -> None:
+        """Deliver the events in the task state change queue to the tasks' pollers.
+
+        A single consumer per queue receives and deletes every message, so events are not
+        passed around between pollers. It stops once no tasks of the queue are polled.
+        """
+        queue_url = self.ecs_task_event_queue_url
+        try:
+            sqs = await self._get_client_async("sqs")
+            while ECSExecutor._task_events.get(queue_url):
+                partial_func = partial(
+                    sqs.receive_message,
+                    QueueUrl=queue_url,
+                    MaxNumberOfMessages=10,
+                    WaitTimeSeconds=TASK_EVENT_WAIT_TIME,
+                )
+                response = await _execute_partial_in_threadpool(partial_func, long_poll=True)
+                messages = response.get("Messages", [])
+                if not messages:
+                    continue
+
+                task_events = ECSExecutor._task_events.get(queue_url, {})
+                for message in messages:
+                    task_arn = _get_event_task_arn(message)
+                    if task_arn is None:
+                        self._debug_log(f"Discarding unexpected task event: {message.get('Body')}")
+                    elif task_arn in task_events:
+                        task_events[task_arn].set()
+
+                partial_func = partial(
+                    sqs.delete_message_batch,
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                        for i, message in enumerate(messages)
+                    ],
+                )
+                await _execute_partial_in_threadpool(partial_func)
+        except Exception as e:
+            app_log.warning(f"AWS ECS Executor: Failed to receive task events: {e}")
+
     async def _get_log_events(self, task_arn, task_metadata: Dict):
         """Retrieve log events from from log stream."""
-        logs = boto3.Session(**self.boto_session_options()).client("logs")
+        logs = await self._get_client_async("logs")
 
-        dispatch_id = task_metadata["dispatch_id"]
-        node_id = task_metadata["node_id"]
         task_id = task_arn.split("/")[-1]
 
         partial_func = partial(
             logs.get_log_events,
             logGroupName=self.log_group_name,
-            logStreamName=f"covalent-fargate/covalent-task-{dispatch_id}-{node_id}/{task_id}",
+            logStreamName=f"covalent-fargate/{CONTAINER_NAME}/{task_id}",
         )
         future = await _execute_partial_in_threadpool(partial_func)
         events = future["events"]
         return "".join(event["message"] + "\n" for event in events)
 
+    def _download_result(self, result_filename: str) -> Any:
+        """Download and unpickle a task's result, in memory unless it is too large."""
+        s3 = self._get_client("s3")
+        response = s3.get_object(Bucket=self.s3_bucket_name, Key=result_filename)
+
+        if response["ContentLength"] <= RESULT_MAX_IN_MEMORY_SIZE:
+            return pickle.loads(response["Body"].read())
+
+        response["Body"].close()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        local_result_filename = os.path.join(self.cache_dir, result_filename)
+        s3.download_file(self.s3_bucket_name, result_filename, local_result_filename)
+        return _load_pickle_file(local_result_filename)
+
     async def query_result(self, task_metadata: Dict) -> Tuple[Any, str, str]:
         """Query and retrieve a completed task's result.
 
@@ -387,23 +681,13 @@ class ECSExecutor(AWSExecutor):
         Returns:
             result: The task's result, as a Python object.
         """
-        s3 = boto3.Session(**self.boto_session_options()).client("s3")
-
         dispatch_id = task_metadata["dispatch_id"]
         node_id = task_metadata["node_id"]
         result_filename = RESULT_FILENAME.format(dispatch_id=dispatch_id, node_id=node_id)
-        local_result_filename = os.path.join(self.cache_dir, result_filename)
-
-        self._debug_log(
-            f"Downloading {result_filename} from bucket {self.s3_bucket_name} to local path ${local_result_filename}"
-        )
-        partial_func = partial(
-            s3.download_file, self.s3_bucket_name, result_filename, local_result_filename
-        )
-        await _execute_partial_in_threadpool(partial_func)
 
+        self._debug_log(f"Downloading {result_filename} from bucket {self.s3_bucket_name}")
         result = await _execute_partial_in_threadpool(
-            partial(_load_pickle_file, local_result_filename)
+            partial(self._download_result, result_filename)
         )
         return result
 
@@ -414,7 +698,7 @@ class ECSExecutor(AWSExecutor):
             task_arn: ARN used to identify an ECS task.
             reason: An optional string used to specify a cancellation reason.
         """
-        ecs = boto3.Session(**self.boto_session_options()).client("ecs")
+        ecs = await self._get_client_async("ecs")
         partial_func = partial(
             ecs.stop_task, cluster=self.ecs_cluster_name, task=task_arn, reason=reason
         )
@@ -17,14 +17,70 @@
 """Helper methods for ECS executor plugin."""
 
 import asyncio
+import hashlib
+import json
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 
-import cloudpickle as pickle
+import cloudpickle
+from botocore.config import Config
 
+# Shared clients serve concurrent tasks, so they need a larger connection pool than the
+# default of 10, and retry throttled control plane calls with client-side rate limiting.
+BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "total_max_attempts": 10},
+)
 
-async def _execute_partial_in_threadpool(partial_func):
+# Bounded by the boto3 client connection pool size so concurrent calls never queue on it
+_IO_THREADPOOL = ThreadPoolExecutor(
+    max_workers=min(32, BOTO_CLIENT_CONFIG.max_pool_connections), thread_name_prefix="ecs-io"
+)
+# Long-polls hold their thread for up to 20 seconds, so they run apart from the bounded
+# pool instead of delaying the short calls queued on it.
+_LONG_POLL_THREADPOOL = ThreadPoolExecutor(thread_name_prefix="ecs-long-poll")
+
+
+async def _execute_partial_in_threadpool(partial_func, long_poll: bool = False):
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, partial_func)
+    executor = _LONG_POLL_THREADPOOL if long_poll else _IO_THREADPOOL
+    return await loop.run_in_executor(executor, partial_func)
+
+
+def _serialize_task(function, args, kwargs) -> bytes:
+    """Serialize a task payload, using cloudpickle only when the standard pickler won't do.
+
+    The standard pickler is faster but pickles functions and classes by reference, which
+    fails for lambdas and local objects and would not resolve in the container for objects
+    defined in __main__.
+    """
+    payload = (function, args, kwargs)
+    try:
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return cloudpickle.dumps(payload)
+
+    if b"__main__" in data:
+        return cloudpickle.dumps(payload)
+    return data
+
+
+def _get_task_definition_key(task_definition: Dict) -> str:
+    """Get a digest identifying the registration parameters of an ECS task definition."""
+    return hashlib.blake2b(
+        json.dumps(task_definition, sort_keys=True, default=str).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _get_event_task_arn(message: Dict) -> Optional[str]:
+    """Get the task ARN of an ECS task state change event received from SQS, if any."""
+    try:
+        task_arn = json.loads(message["Body"])["detail"]["taskArn"]
+    except (KeyError, TypeError, ValueError):
+        return None
+    return task_arn if isinstance(task_arn, str) else None
 
 
 def _load_pickle_file(filename):
@@ -16,16 +16,30 @@
 
 """Unit tests for AWS ECS executor."""
 
+import asyncio
+import io
+import json
 import os
+import pickle
 import shutil
+import threading
 from pathlib import Path
 from unittest import mock
 from unittest.mock import AsyncMock
 
-import cloudpickle as pickle
+import botocore.exceptions
 import pytest
 
-from covalent_ecs_plugin.ecs import FUNC_FILENAME, RESULT_FILENAME, ECSExecutor
+import covalent_ecs_plugin.ecs as ecs_module
+from covalent_ecs_plugin.ecs import (
+    BOTO_CLIENT_CONFIG,
+    CONTAINER_NAME,
+    FUNC_FILENAME,
+    RESULT_FILENAME,
+    RESULT_MAX_IN_MEMORY_SIZE,
+    ECSExecutor,
+    InvalidCredentials,
+)
 
 
 class TestECSExecutor:
@@ -43,6 +57,7 @@ class TestECSExecutor:
     MOCK_DISPATCH_ID = 112233
     MOCK_NODE_ID = 1
     MOCK_TASK_ARN = "task-arn/123"
+    MOCK_EVENT_QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/1234/task-events"
 
     @property
     def MOCK_FUNC_FILENAME(self):
@@ -56,6 +71,16 @@ class TestECSExecutor:
     def MOCK_TASK_METADATA(self):
         return {"dispatch_id": self.MOCK_DISPATCH_ID, "node_id": self.MOCK_NODE_ID}
 
+    @pytest.fixture(autouse=True)
+    def clear_class_caches(self, mocker):
+        """Reset the process-wide caches shared by executor instances."""
+        mocker.patch.dict(ECSExecutor._boto_sessions, clear=True)
+        mocker.patch.dict(ECSExecutor._boto_clients, clear=True)
+        mocker.patch.dict(ECSExecutor._task_definition_arns, clear=True)
+        mocker.patch.dict(ECSExecutor._caller_identities, clear=True)
+        mocker.patch.dict(ECSExecutor._task_events, clear=True)
+        mocker.patch.dict(ECSExecutor._task_event_consumers, clear=True)
+
     @pytest.fixture
     def mock_executor_config(self, tmp_path):
         MOCK_CREDENTIALS_FILE: Path = tmp_path / "credentials"
@@ -91,7 +116,9 @@ class TestECSExecutor:
             "covalent_ecs_plugin.ecs.ECSExecutor._is_valid_security_group", return_value=True
         )
 
-        executor = ECSExecutor(**mock_executor_config)
+        executor = ECSExecutor(
+            **mock_executor_config, ecs_task_event_queue_url=self.MOCK_EVENT_QUEUE_URL
+        )
 
         assert executor.profile == self.MOCK_PROFILE
         assert executor.s3_bucket_name == self.MOCK_S3_BUCKET_NAME
@@ -103,27 +130,87 @@ class TestECSExecutor:
         assert executor.vcpu == self.MOCK_VCPU
         assert executor.memory == self.MOCK_MEMORY
         assert executor.poll_freq == self.MOCK_POLL_FREQ
+        assert executor.ecs_task_event_queue_url == self.MOCK_EVENT_QUEUE_URL
+
+    @mock.patch.dict(os.environ)
+    def test_credentials_file_passed_to_session(self, mock_executor_config, tmp_path):
+        """Test the credentials file is passed to boto3 sessions instead of os.environ."""
+        os.environ.pop("AWS_SHARED_CREDENTIALS_FILE", None)
+        mock_credentials_file = str(tmp_path / "credentials")
+        with open(mock_credentials_file, "w") as f:
+            f.write(
+                f"[{self.MOCK_PROFILE}]\naws_access_key_id = key\naws_secret_access_key = secret\n"
+            )
+        executor = ECSExecutor(**mock_executor_config, credentials=mock_credentials_file)
+
+        assert executor.credentials_file == mock_credentials_file
+        assert "AWS_SHARED_CREDENTIALS_FILE" not in os.environ
+
+        boto_session = executor._get_boto_session()
+        assert boto_session._session.get_config_variable("credentials_file") == (
+            mock_credentials_file
+        )
+        assert boto_session.profile_name == self.MOCK_PROFILE
+        assert boto_session.get_credentials().access_key == "key"
+
+    def test_boto_session_is_shared(self, mocker, mock_executor_config):
+        """Test executors with the same AWS settings share one boto3 session."""
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+
+        executor_1 = ECSExecutor(**mock_executor_config)
+        executor_2 = ECSExecutor(**mock_executor_config)
+        assert executor_1._get_boto_session() is executor_2._get_boto_session()
+        boto3_mock.Session.assert_called_once()
+
+        executor_2.profile = "other_profile"
+        executor_2._get_boto_session()
+        assert boto3_mock.Session.call_count == 2
+
+    def test_get_client_is_cached(self, mocker, mock_executor):
+        """Test AWS clients are created once and reused."""
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        boto3_mock.Session().client.side_effect = lambda service_name, config: mock.MagicMock()
+
+        ecs_client = mock_executor._get_client("ecs")
+        assert mock_executor._get_client("ecs") is ecs_client
+        assert mock_executor._get_client("s3") is not ecs_client
+        assert boto3_mock.Session().client.call_count == 2
+        boto3_mock.Session().client.assert_called_with("s3", config=BOTO_CLIENT_CONFIG)
+
+    @pytest.mark.asyncio
+    async def test_get_client_async(self, mocker, mock_executor):
+        """Test cached AWS clients are returned without a threadpool round-trip."""
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        threadpool_spy = mocker.spy(ecs_module, "_execute_partial_in_threadpool")
+
+        ecs_client = await mock_executor._get_client_async("ecs")
+        assert ecs_client is boto3_mock.Session().client()
+        assert threadpool_spy.call_count == 1
+
+        assert await mock_executor._get_client_async("ecs") is ecs_client
+        assert threadpool_spy.call_count == 1
 
     @pytest.mark.asyncio
     async def test_upload_file_to_s3(self, mock_executor, mocker):
         """Test to upload file to s3."""
-        Path(mock_executor.cache_dir).mkdir(parents=True, exist_ok=True)
-
         boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
-
-        def some_function():
-            pass
+        s3_client_mock = boto3_mock.Session().client()
 
         mock_executor._upload_task_to_s3(
-            some_function,
             self.MOCK_DISPATCH_ID,
             self.MOCK_NODE_ID,
-            ("some_arg"),
-            {"some": "kwarg"},
+            sum,
+            ([1, 2],),
+            {"start": 1},
         )
-        boto3_mock.Session().client().upload_file.assert_called_once()
+        s3_client_mock.upload_file.assert_not_called()
+        s3_client_mock.upload_fileobj.assert_called_once()
 
-        shutil.rmtree(mock_executor.cache_dir)
+        function_file, bucket, key = s3_client_mock.upload_fileobj.call_args.args
+        assert bucket == self.MOCK_S3_BUCKET_NAME
+        assert key == self.MOCK_FUNC_FILENAME
+        assert pickle.loads(function_file.getvalue()) == (sum, ([1, 2],), {"start": 1})
+        assert not Path(mock_executor.cache_dir).exists()
 
     @pytest.mark.asyncio
     async def test_upload_task(self, mock_executor, mocker):
@@ -150,6 +237,148 @@ class TestECSExecutor:
         boto3_mock.Session().client().register_task_definition.assert_called_once()
         boto3_mock.Session().client().run_task.assert_called_once()
 
+        overrides = boto3_mock.Session().client().run_task.call_args.kwargs["overrides"]
+        assert overrides["containerOverrides"][0]["environment"] == [
+            {"name": "COVALENT_TASK_FUNC_FILENAME", "value": self.MOCK_FUNC_FILENAME},
+            {"name": "RESULT_FILENAME", "value": self.MOCK_RESULT_FILENAME},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_submit_task_reuses_task_definition(self, mock_executor, mocker):
+        """Test that the task definition is registered once and reused across tasks."""
+        MOCK_IDENTITY = {"Account": 1234}
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        ecs_client_mock = boto3_mock.Session().client()
+        ecs_client_mock.register_task_definition.return_value = {
+            "taskDefinition": {"taskDefinitionArn": "task-definition-arn"}
+        }
+
+        await mock_executor.submit_task(self.MOCK_TASK_METADATA, MOCK_IDENTITY)
+        await mock_executor.submit_task(
+            {"dispatch_id": self.MOCK_DISPATCH_ID, "node_id": self.MOCK_NODE_ID + 1}, MOCK_IDENTITY
+        )
+
+        ecs_client_mock.register_task_definition.assert_called_once()
+        assert ecs_client_mock.run_task.call_count == 2
+        assert ecs_client_mock.run_task.call_args.kwargs["taskDefinition"] == "task-definition-arn"
+
+    @pytest.mark.asyncio
+    async def test_submit_task_reregisters_deregistered_task_definition(
+        self, mock_executor, mocker
+    ):
+        """Test that a cached task definition rejected as inactive is registered again."""
+
+        def mock_client_error(code, message):
+            return botocore.exceptions.ClientError(
+                {"Error": {"Code": code, "Message": message}}, "RunTask"
+            )
+
+        MOCK_IDENTITY = {"Account": 1234}
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        ecs_client_mock = boto3_mock.Session().client()
+        ecs_client_mock.register_task_definition.side_effect = lambda **kwargs: {
+            "taskDefinition": {
+                "taskDefinitionArn": "task-definition-arn:"
+                f"{ecs_client_mock.register_task_definition.call_count}"
+            }
+        }
+        inactive_error = mock_client_error("ClientException", "TaskDefinition is inactive")
+
+        # Errors are raised as is for a task definition that was just registered
+        ecs_client_mock.run_task.side_effect = inactive_error
+        with pytest.raises(botocore.exceptions.ClientError):
+            await mock_executor.submit_task(self.MOCK_TASK_METADATA, MOCK_IDENTITY)
+        assert ecs_client_mock.register_task_definition.call_count == 1
+        assert ecs_client_mock.run_task.call_count == 1
+
+        # Errors unrelated to the task definition are raised without registering it again
+        for error in [
+            mock_client_error("AccessDeniedException", "Not authorized to perform ecs:RunTask"),
+            mock_client_error("InvalidParameterException", "Error retrieving subnet information"),
+            mock_client_error("ThrottlingException", "Rate exceeded"),
+        ]:
+            ecs_client_mock.run_task.side_effect = error
+            with pytest.raises(botocore.exceptions.ClientError):
+                await mock_executor.submit_task(self.MOCK_TASK_METADATA, MOCK_IDENTITY)
+        assert ecs_client_mock.register_task_definition.call_count == 1
+        assert ecs_client_mock.run_task.call_count == 4
+
+        # An inactive cached task definition is registered again and the task retried once
+        ecs_client_mock.run_task.reset_mock()
+        ecs_client_mock.run_task.side_effect = [inactive_error, mock.DEFAULT]
+        await mock_executor.submit_task(self.MOCK_TASK_METADATA, MOCK_IDENTITY)
+
+        assert ecs_client_mock.register_task_definition.call_count == 2
+        run_task_definitions = [
+            c.kwargs["taskDefinition"] for c in ecs_client_mock.run_task.call_args_list
+        ]
+        assert run_task_definitions == ["task-definition-arn:1", "task-definition-arn:2"]
+
+        # The new revision is cached for later tasks
+        ecs_client_mock.run_task.side_effect = None
+        await mock_executor.submit_task(self.MOCK_TASK_METADATA, MOCK_IDENTITY)
+        assert ecs_client_mock.register_task_definition.call_count == 2
+        assert (
+            ecs_client_mock.run_task.call_args.kwargs["taskDefinition"] == "task-definition-arn:2"
+        )
+
+    def test_validate_credentials(self, mocker, mock_executor):
+        """Test that invalid credentials are reported for STS client errors."""
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        sts_client_mock = boto3_mock.Session().client()
+        sts_client_mock.get_caller_identity.return_value = {"Account": 1234}
+        assert mock_executor._validate_credentials() == {"Account": 1234}
+
+        sts_client_mock.get_caller_identity.side_effect = botocore.exceptions.ClientError(
+            {"Error": {"Code": "InvalidClientTokenId", "Message": "Invalid token"}},
+            "GetCallerIdentity",
+        )
+        assert mock_executor._validate_credentials(raise_exception=False) is False
+        with pytest.raises(InvalidCredentials):
+            mock_executor._validate_credentials()
+
+    def test_is_inactive_task_definition_error(self, mock_executor):
+        """Test the detection of run_task errors about inactive task definitions."""
+
+        def mock_client_error(code, message):
+            return botocore.exceptions.ClientError(
+                {"Error": {"Code": code, "Message": message}}, "RunTask"
+            )
+
+        assert mock_executor._is_inactive_task_definition_error(
+            mock_client_error("ClientException", "TaskDefinition is inactive")
+        )
+        assert mock_executor._is_inactive_task_definition_error(
+            mock_client_error("InvalidParameterException", "Unable to describe task definition.")
+        )
+        assert not mock_executor._is_inactive_task_definition_error(
+            mock_client_error("InvalidParameterException", "Error retrieving subnet information")
+        )
+        assert not mock_executor._is_inactive_task_definition_error(
+            mock_client_error("AccessDeniedException", "TaskDefinition is inactive")
+        )
+
+    @pytest.mark.asyncio
+    async def test_register_task_definition_cache_is_bounded(self, mock_executor, mocker):
+        """Test that the least recently used task definition is evicted from the cache."""
+        mocker.patch("covalent_ecs_plugin.ecs.TASK_DEFINITION_CACHE_SIZE", 2)
+        ecs_client_mock = mocker.MagicMock()
+        ecs_client_mock.register_task_definition.side_effect = lambda family: {
+            "taskDefinition": {"taskDefinitionArn": f"{family}-arn"}
+        }
+
+        for family in ["a", "b", "a", "c", "a", "b"]:
+            arn = await mock_executor._register_task_definition(
+                ecs_client_mock, {"family": family}
+            )
+            assert arn == f"{family}-arn"
+
+        registered = [
+            c.kwargs["family"] for c in ecs_client_mock.register_task_definition.call_args_list
+        ]
+        assert registered == ["a", "b", "c", "b"]
+        assert len(ECSExecutor._task_definition_arns) == 2
+
     def test_is_valid_subnet_id(self, mock_executor):
         """Test the valid subnet checking method."""
         assert mock_executor._is_valid_subnet_id("subnet-871545e1") is True
@@ -172,24 +401,52 @@ class TestECSExecutor:
         )
 
     @pytest.mark.asyncio
-    async def test_query_result(self, mocker, mock_executor, tmp_path: Path):
+    async def test_query_result(self, mocker, mock_executor):
         """Test the method to query the result."""
-        Path(mock_executor.cache_dir).mkdir(parents=True, exist_ok=True)
+        MOCK_RESULT_CONTENTS = "mock_result"
+        result_bytes = pickle.dumps(MOCK_RESULT_CONTENTS)
+
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        s3_client_mock = boto3_mock.Session().client()
+        s3_client_mock.get_object.return_value = {
+            "ContentLength": len(result_bytes),
+            "Body": io.BytesIO(result_bytes),
+        }
+
+        result = await mock_executor.query_result(task_metadata=self.MOCK_TASK_METADATA)
+        assert result == MOCK_RESULT_CONTENTS
+
+        s3_client_mock.get_object.assert_called_once_with(
+            Bucket=self.MOCK_S3_BUCKET_NAME, Key=self.MOCK_RESULT_FILENAME
+        )
+        s3_client_mock.download_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_large_result(self, mocker, mock_executor):
+        """Test that large results are downloaded to the cache directory."""
         mock_local_result_path = Path(mock_executor.cache_dir) / self.MOCK_RESULT_FILENAME
-        mock_local_result_path.touch()
 
         MOCK_RESULT_CONTENTS = "mock_result"
 
-        with open(mock_local_result_path, "wb") as f:
-            pickle.dump(MOCK_RESULT_CONTENTS, f)
+        def mock_download_file(bucket, key, filename):
+            with open(filename, "wb") as f:
+                pickle.dump(MOCK_RESULT_CONTENTS, f)
 
         boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        s3_client_mock = boto3_mock.Session().client()
+        s3_client_mock.download_file.side_effect = mock_download_file
+        s3_client_mock.get_object.return_value = {
+            "ContentLength": RESULT_MAX_IN_MEMORY_SIZE + 1,
+            "Body": io.BytesIO(),
+        }
+
         result = await mock_executor.query_result(task_metadata=self.MOCK_TASK_METADATA)
         assert result == MOCK_RESULT_CONTENTS
 
-        boto3_mock.Session().client().download_file.assert_called_once_with(
+        s3_client_mock.download_file.assert_called_once_with(
             self.MOCK_S3_BUCKET_NAME, self.MOCK_RESULT_FILENAME, str(mock_local_result_path)
         )
+        assert not mock_local_result_path.exists()
         shutil.rmtree(mock_executor.cache_dir)
 
     @pytest.mark.asyncio
@@ -204,6 +461,10 @@ class TestECSExecutor:
             "task-arn", task_metadata=self.MOCK_TASK_METADATA
         )
         assert log_events == "hello\nworld\n"
+        boto3_mock.Session().client().get_log_events.assert_called_with(
+            logGroupName=self.MOCK_ECS_LOG_GROUP_NAME,
+            logStreamName=f"covalent-fargate/{CONTAINER_NAME}/task-arn",
+        )
 
     @pytest.mark.asyncio
     async def test_get_status(self, mocker, mock_executor):
@@ -212,14 +473,17 @@ class TestECSExecutor:
         ecs_client_mock = boto3_mock.Session().client()
 
         # Case 1: no tasks found
-        ecs_client_mock.get_paginator().paginate.return_value = []
+        ecs_client_mock.describe_tasks.return_value = {
+            "tasks": [],
+            "failures": [{"arn": self.MOCK_TASK_ARN, "reason": "MISSING"}],
+        }
         res = await mock_executor.get_status(self.MOCK_TASK_ARN)
         assert res == ("TASK_NOT_FOUND", -1)
+        ecs_client_mock.describe_tasks.assert_called_with(
+            cluster=self.MOCK_ECS_CLUSTER_NAME, tasks=[self.MOCK_TASK_ARN]
+        )
 
         # Case 2 valid task found
-        ecs_client_mock.get_paginator().paginate.return_value = [
-            {"taskArns": [self.MOCK_TASK_ARN]}
-        ]
         ecs_client_mock.describe_tasks.return_value = {
             "tasks": [
                 {
@@ -233,15 +497,23 @@ class TestECSExecutor:
         assert res == ("RUNNING", 1)
 
         # Case 3 - task found without any status
-        ecs_client_mock.get_paginator().paginate.return_value = [
-            {"taskArns": [self.MOCK_TASK_ARN]}
-        ]
         ecs_client_mock.describe_tasks.return_value = {
             "tasks": [{"taskArn": self.MOCK_TASK_ARN, "lastStatus": "FAILED"}]
         }
         res = await mock_executor.get_status(self.MOCK_TASK_ARN)
         assert res == ("FAILED", -1)
 
+        ecs_client_mock.get_paginator.assert_not_called()
+
+    def test_poll_interval(self, mocker, mock_executor):
+        """Test the poll interval backs off exponentially up to the poll frequency."""
+        mocker.patch("covalent_ecs_plugin.ecs.random.random", return_value=0.5)
+        mock_executor.poll_freq = 10
+
+        intervals = [mock_executor._poll_interval(attempt) for attempt in range(6)]
+        assert intervals == [1.5, 2.5, 4.5, 8.5, 9.5, 9.5]
+        assert mock_executor._poll_interval(5000) == 9.5
+
     @pytest.mark.asyncio
     async def test_poll_ecs_task(self, mocker, mock_executor):
         """Test the method to poll the ecs task."""
@@ -251,14 +523,220 @@ class TestECSExecutor:
 
         mocker.patch(
             "covalent_ecs_plugin.ecs.ECSExecutor.get_status",
-            side_effect=[("RUNNING", 1), ("STOPPED", 0)],
+            side_effect=[("RUNNING", 1), ("RUNNING", 1), ("RUNNING", 1), ("STOPPED", 0)],
         )
         await mock_executor._poll_task(self.MOCK_TASK_ARN)
-        sleep_mock.assert_called_once_with(self.MOCK_POLL_FREQ)
 
+        sleep_intervals = [call.args[0] for call in sleep_mock.call_args_list]
+        assert len(sleep_intervals) == 3
+        assert sleep_intervals == sorted(sleep_intervals)
+        assert all(interval <= self.MOCK_POLL_FREQ for interval in sleep_intervals)
+
+        # The backoff stops growing once it reaches the poll frequency
+        mock_executor.poll_freq = 4
+        poll_interval_spy = mocker.spy(mock_executor, "_poll_interval")
+        mocker.patch(
+            "covalent_ecs_plugin.ecs.ECSExecutor.get_status",
+            side_effect=[("RUNNING", 1)] * 5 + [("STOPPED", 0)],
+        )
+        await mock_executor._poll_task(self.MOCK_TASK_ARN)
+        assert [call.args[0] for call in poll_interval_spy.call_args_list] == [0, 1, 2, 2, 2]
+
+        mocker.patch(
+            "covalent_ecs_plugin.ecs.ECSExecutor.get_status",
+            side_effect=[("RUNNING", 1), ("STOPPED", 1)],
+        )
         with pytest.raises(Exception):
             await mock_executor._poll_task(self.MOCK_TASK_ARN)
 
+    @pytest.mark.asyncio
+    async def test_poll_ecs_task_with_event_queue(self, mocker, mock_executor):
+        """Test the task status is checked after every wait on the event queue."""
+
+        mock_executor.ecs_task_event_queue_url = self.MOCK_EVENT_QUEUE_URL
+        sleep_mock = mocker.patch("covalent_ecs_plugin.ecs.asyncio.sleep")
+        wait_mock = mocker.patch(
+            "covalent_ecs_plugin.ecs.ECSExecutor._wait_for_task_event",
+            side_effect=[False, True],
+        )
+        get_status_mock = mocker.patch(
+            "covalent_ecs_plugin.ecs.ECSExecutor.get_status",
+            side_effect=[("RUNNING", -1), ("RUNNING", -1), ("STOPPED", 0)],
+        )
+
+        await mock_executor._poll_task(self.MOCK_TASK_ARN)
+        assert wait_mock.call_count == 2
+        assert get_status_mock.call_count == 3
+        sleep_mock.assert_not_called()
+        assert self.MOCK_EVENT_QUEUE_URL not in ECSExecutor._task_events
+
+    @pytest.mark.asyncio
+    async def test_poll_long_running_ecs_task_with_event_queue(self, mocker, mock_executor):
+        """Test a task is described only before waiting and once its event arrives."""
+        mock_executor.ecs_task_event_queue_url = self.MOCK_EVENT_QUEUE_URL
+        # Waiting for a status check without an event would time out the test
+        mock_executor.poll_freq = 0.01
+        stopped_tasks = set()
+
+        # Many empty long-polls, each up to 20 seconds, before the task stops
+        receive_responses = [{}] * 50 + [
+            {
+                "Messages": [
+                    {
+                        "Body": json.dumps({"detail": {"taskArn": self.MOCK_TASK_ARN}}),
+                        "ReceiptHandle": "receipt",
+                    }
+                ]
+            }
+        ]
+
+        def mock_receive_message(**kwargs):
+            response = receive_responses.pop(0) if receive_responses else {}
+            if "Messages" in response:
+                stopped_tasks.add(self.MOCK_TASK_ARN)
+            return response
+
+        async def mock_get_status(task_arn):
+            return ("STOPPED", 0) if task_arn in stopped_tasks else ("RUNNING", -1)
+
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        sqs_client_mock = boto3_mock.Session().client()
+        sqs_client_mock.receive_message.side_effect = mock_receive_message
+        get_status_mock = mocker.patch(
+            "covalent_ecs_plugin.ecs.ECSExecutor.get_status", side_effect=mock_get_status
+        )
+
+        await asyncio.wait_for(mock_executor._poll_task(self.MOCK_TASK_ARN), timeout=5)
+        assert sqs_client_mock.receive_message.call_count >= 51
+        assert get_status_mock.call_count == 2
+        await asyncio.wait_for(
+            ECSExecutor._task_event_consumers[self.MOCK_EVENT_QUEUE_URL], timeout=5
+        )
+
+    @pytest.mark.asyncio
+    async def test_wait_for_task_event_timeout(self, mocker, mock_executor):
+        """Test waiting for a task event ends after the status check interval."""
+        mocker.patch("covalent_ecs_plugin.ecs.TASK_EVENT_STATUS_CHECK_INTERVAL", 0.1)
+        mock_executor.ecs_task_event_queue_url = self.MOCK_EVENT_QUEUE_URL
+        mock_executor.poll_freq = 0.01
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        sqs_client_mock = boto3_mock.Session().client()
+        receive_threads = []
+        sqs_client_mock.receive_message.side_effect = (
+            lambda **kwargs: receive_threads.append(threading.current_thread().name) or {}
+        )
+
+        ECSExecutor._task_events[self.MOCK_EVENT_QUEUE_URL] = {self.MOCK_TASK_ARN: asyncio.Event()}
+        assert await mock_executor._wait_for_task_event(self.MOCK_TASK_ARN) is False
+        ECSExecutor._task_events.clear()
+        await ECSExecutor._task_event_consumers[self.MOCK_EVENT_QUEUE_URL]
+
+        assert sqs_client_mock.receive_message.call_args.kwargs == {
+            "QueueUrl": self.MOCK_EVENT_QUEUE_URL,
+            "MaxNumberOfMessages": 10,
+            "WaitTimeSeconds": 20,
+        }
+        assert all(name.startswith("ecs-long-poll") for name in receive_threads)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_task_event_consumer_failure(self, mocker, mock_executor):
+        """Test waiting for a task event ends after poll_freq if the queue can't be read."""
+        mock_executor.ecs_task_event_queue_url = self.MOCK_EVENT_QUEUE_URL
+        mock_executor.poll_freq = 0.01
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        sqs_client_mock = boto3_mock.Session().client()
+        sqs_client_mock.receive_message.side_effect = Exception("AccessDenied")
+        app_log_mock = mocker.patch("covalent_ecs_plugin.ecs.app_log")
+
+        ECSExecutor._task_events[self.MOCK_EVENT_QUEUE_URL] = {self.MOCK_TASK_ARN: asyncio.Event()}
+        wait = mock_executor._wait_for_task_event(self.MOCK_TASK_ARN)
+        assert await asyncio.wait_for(wait, timeout=5) is False
+        app_log_mock.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_consume_task_events_per_queue(self, mocker, mock_executor):
+        """Test a consumer stops when no tasks of its own queue are polled."""
+        mock_executor.ecs_task_event_queue_url = self.MOCK_EVENT_QUEUE_URL
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        sqs_client_mock = boto3_mock.Session().client()
+
+        ECSExecutor._task_events["other-queue-url"] = {self.MOCK_TASK_ARN: asyncio.Event()}
+        await asyncio.wait_for(mock_executor._consume_task_events(), timeout=5)
+        sqs_client_mock.receive_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_poll_ecs_tasks_with_event_queue(self, mocker, mock_executor):
+        """Test concurrent pollers are woken by their task's event, whichever starts waiting."""
+
+        def mock_message(body, receipt_handle):
+            return {"Body": body, "ReceiptHandle": receipt_handle}
+
+        def mock_event(task_arn):
+            body = json.dumps({"detail": {"taskArn": task_arn, "lastStatus": "STOPPED"}})
+            return mock_message(body, f"{task_arn}-receipt")
+
+        mock_executor.ecs_task_event_queue_url = self.MOCK_EVENT_QUEUE_URL
+        # Waiting for a status check without an event would time out the test
+        mock_executor.poll_freq = 60
+
+        stopped_tasks = set()
+        # The first poller starts consuming events but the first event is the second task's
+        event_batches = [
+            [
+                mock_event("task-arn/2"),
+                mock_message("not json", "malformed-receipt"),
+                mock_message(json.dumps({"detail": {}}), "test-event-receipt"),
+            ],
+            [mock_event("task-arn/1")],
+        ]
+
+        def mock_receive_message(**kwargs):
+            if not event_batches:
+                return {}
+            messages = event_batches.pop(0)
+            stopped_tasks.update(
+                json.loads(m["Body"])["detail"]["taskArn"]
+                for m in messages
+                if m["ReceiptHandle"].startswith("task-arn")
+            )
+            return {"Messages": messages}
+
+        async def mock_get_status(task_arn):
+            return ("STOPPED", 0) if task_arn in stopped_tasks else ("RUNNING", -1)
+
+        boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
+        sqs_client_mock = boto3_mock.Session().client()
+        sqs_client_mock.receive_message.side_effect = mock_receive_message
+        get_status_mock = mocker.patch(
+            "covalent_ecs_plugin.ecs.ECSExecutor.get_status", side_effect=mock_get_status
+        )
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                mock_executor._poll_task("task-arn/1"), mock_executor._poll_task("task-arn/2")
+            ),
+            timeout=5,
+        )
+        assert get_status_mock.call_count == 4
+        assert not ECSExecutor._task_events
+
+        # The consumer stops once no tasks are polled
+        await asyncio.wait_for(
+            ECSExecutor._task_event_consumers[self.MOCK_EVENT_QUEUE_URL], timeout=5
+        )
+
+        deleted_receipt_handles = [
+            entry["ReceiptHandle"]
+            for call in sqs_client_mock.delete_message_batch.call_args_list
+            for entry in call.kwargs["Entries"]
+        ]
+        assert deleted_receipt_handles == [
+            "task-arn/2-receipt",
+            "malformed-receipt",
+            "test-event-receipt",
+            "task-arn/1-receipt",
+        ]
+
     @pytest.mark.asyncio
     async def test_run(self, mocker, mock_executor):
         """Test the run method."""
@@ -272,7 +750,9 @@ class TestECSExecutor:
 
         boto3_mock = mocker.patch("covalent_ecs_plugin.ecs.boto3")
 
-        upload_task_mock = mocker.patch("covalent_ecs_plugin.ecs.ECSExecutor._upload_task")
+        upload_task_mock = mocker.patch(
+            "covalent_ecs_plugin.ecs.ECSExecutor._upload_task", new_callable=AsyncMock
+        )
         validate_credentials_mock = mocker.patch(
             "covalent_ecs_plugin.ecs.ECSExecutor._validate_credentials"
         )
@@ -287,11 +767,19 @@ class TestECSExecutor:
         )
 
         upload_task_mock.assert_called_once_with(mock_func, [], {"x": 1}, self.MOCK_TASK_METADATA)
-        validate_credentials_mock.assert_called_once()
+        validate_credentials_mock.assert_called_once_with(raise_exception=True)
         submit_task_mock.assert_called_once_with(self.MOCK_TASK_METADATA, MOCK_IDENTITY)
 
         returned_task_arn = await submit_task_mock()
 
         _poll_task_mock.assert_called_once_with(returned_task_arn)
         query_result_mock.assert_called_once_with(self.MOCK_TASK_METADATA)
-        shutil.rmtree(mock_executor.cache_dir)
+
+        # The caller identity is reused by subsequent runs with the same credentials
+        await mock_executor.run(
+            function=mock_func, args=[], kwargs={"x": 1}, task_metadata=self.MOCK_TASK_METADATA
+        )
+        validate_credentials_mock.assert_called_once()
+        assert upload_task_mock.call_count == 2
+        assert submit_task_mock.call_args.args == (self.MOCK_TASK_METADATA, MOCK_IDENTITY)
+        assert not Path(mock_executor.cache_dir).exists()
@@ -16,13 +16,26 @@
 
 """Unit tests for AWS ECS executor utils file."""
 
+import json
+import sys
+import threading
 from functools import partial
 from pathlib import Path
 
 import cloudpickle as pickle
 import pytest
 
-from covalent_ecs_plugin.utils import _execute_partial_in_threadpool, _load_pickle_file
+from covalent_ecs_plugin.utils import (
+    _execute_partial_in_threadpool,
+    _get_event_task_arn,
+    _get_task_definition_key,
+    _load_pickle_file,
+    _serialize_task,
+)
+
+
+def module_level_function(x):
+    return x
 
 
 @pytest.mark.asyncio
@@ -36,6 +49,14 @@ async def test_execute_partial_in_threadpool():
     future = await _execute_partial_in_threadpool(partial_func)
     assert future == 1
 
+    thread_name = await _execute_partial_in_threadpool(lambda: threading.current_thread().name)
+    assert thread_name.startswith("ecs-io")
+
+    thread_name = await _execute_partial_in_threadpool(
+        lambda: threading.current_thread().name, long_poll=True
+    )
+    assert thread_name.startswith("ecs-long-poll")
+
 
 def test_load_pickle_file(mocker):
     """Test the method used to load the pickled file and delete the file afterwards."""
@@ -47,3 +68,49 @@ def test_load_pickle_file(mocker):
     res = _load_pickle_file(temp_fp)
     assert res == "test success"
     assert not Path(temp_fp).exists()
+
+
+def test_serialize_task(mocker, monkeypatch):
+    """Test tasks are serialized with the standard pickler unless cloudpickle is needed."""
+    cloudpickle_dumps_mock = mocker.patch(
+        "covalent_ecs_plugin.utils.cloudpickle.dumps", side_effect=pickle.dumps
+    )
+
+    # Case 1: module level functions are pickled by reference
+    data = _serialize_task(module_level_function, [1], {"x": 2})
+    cloudpickle_dumps_mock.assert_not_called()
+    assert pickle.loads(data) == (module_level_function, [1], {"x": 2})
+
+    # Case 2: lambdas cannot be pickled by reference
+    data = _serialize_task(lambda x: x, [1], {})
+    cloudpickle_dumps_mock.assert_called_once()
+    function, args, kwargs = pickle.loads(data)
+    assert function(3) == 3
+
+    # Case 3: objects defined in __main__ would not resolve in the container
+    monkeypatch.setattr(module_level_function, "__module__", "__main__")
+    monkeypatch.setattr(
+        sys.modules["__main__"], "module_level_function", module_level_function, raising=False
+    )
+    _serialize_task(module_level_function, [], {})
+    assert cloudpickle_dumps_mock.call_count == 2
+
+
+def test_get_event_task_arn():
+    """Test getting the task ARN of a task state change event, ignoring other messages."""
+    event = {"detail": {"taskArn": "task-arn", "lastStatus": "STOPPED"}}
+    assert _get_event_task_arn({"Body": json.dumps(event)}) == "task-arn"
+
+    assert _get_event_task_arn({"Body": "not json"}) is None
+    assert _get_event_task_arn({"Body": json.dumps({"detail": {}})}) is None
+    assert _get_event_task_arn({"Body": json.dumps(["detail"])}) is None
+    assert _get_event_task_arn({"Body": json.dumps({"detail": {"taskArn": None}})}) is None
+    assert _get_event_task_arn({}) is None
+
+
+def test_get_task_definition_key():
+    """Test task definitions are identified by their parameters, regardless of order."""
+    key = _get_task_definition_key({"family": "covalent-task", "cpu": "2"})
+    assert key == _get_task_definition_key({"cpu": "2", "family": "covalent-task"})
+    assert key != _get_task_definition_key({"family": "covalent-task", "cpu": "4"})
+    assert len(key) == 32